@@ -6,33 +6,269 @@ Connects to Azure Key Vault using credentials from .env file
 
 import os
 import sys
+import json
+import types
+import importlib
+import ipaddress
 import ssl
+import time
+import functools
+import logging
+import threading
 import urllib3
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterator, Tuple
 from dotenv import load_dotenv
-from azure.identity import DefaultAzureCredential
 from azure.keyvault.secrets import SecretClient
 from azure.core.exceptions import AzureError
-from azure.core.pipeline.transport import RequestsTransport
+from azure.core.pipeline.policies import RetryPolicy
+from azure.core.pipeline.transport import HttpTransport, RequestsTransport
 import requests
 from urllib.parse import urlparse
 
+if TYPE_CHECKING:
+    from azure.core.credentials import TokenCredential
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on parallel secret fetches; keeps bursts well below the
+# Key Vault throttling limit (4000 GET requests per 10 seconds per vault)
+DEFAULT_MAX_WORKERS = 16
+
+# Keep-alive connections kept per host; sized above DEFAULT_MAX_WORKERS so
+# parallel fetches reuse pooled connections instead of opening new TLS sessions
+CONNECTION_POOL_SIZE = 32
+
+# azure-core retry settings: 5 retries each (azure-core's default is 3) for
+# retryable status codes, connection errors and read errors, within the default
+# overall cap of 10; exponential backoff capped at 30s, Retry-After honoured on 429
+RETRY_OPTIONS = {
+    'retry_total': 10,
+    'retry_status': 5,
+    'retry_connect': 5,
+    'retry_read': 5,
+    'retry_backoff_factor': 0.5,
+    'retry_backoff_max': 30,
+    'retry_on_status_codes': [408, 429, 500, 502, 503, 504],
+}
+
+# Secrets per page when listing the vault
+LIST_PAGE_SIZE = 25
+
+# Upper bound on secret values kept in each client's in-memory cache
+SECRET_CACHE_MAX_ENTRIES = 1024
+
+# Seconds secret values stay cached when KV_CACHE_TTL isn't set
+DEFAULT_CACHE_TTL = 300
+
+# AZURE_CREDENTIAL_TYPE values and the azure.identity credential they select.
+# Picking a specific credential skips DefaultAzureCredential's probing chain.
+CREDENTIAL_TYPES = {
+    'default': 'DefaultAzureCredential',
+    'cli': 'AzureCliCredential',
+    'managed_identity': 'ManagedIdentityCredential',
+    'workload_identity': 'WorkloadIdentityCredential',
+    'environment': 'EnvironmentCredential',
+}
+
+# Guards first-time construction of the shared credential and clients
+_lock = threading.RLock()
+
+@functools.lru_cache(maxsize=None)
+def _load_dotenv_once() -> None:
+    """Load the .env file on first use only; it's searched for and parsed once per process"""
+    load_dotenv()
+
+def _credential_class_name(credential_type: Optional[str]) -> str:
+    """Map an AZURE_CREDENTIAL_TYPE value to an azure.identity class name"""
+    key = (credential_type or 'default').strip().lower().replace('-', '_')
+    if key not in CREDENTIAL_TYPES:
+        raise ValueError(
+            f"Unknown AZURE_CREDENTIAL_TYPE '{credential_type}'. "
+            f"Expected one of: {', '.join(CREDENTIAL_TYPES)}"
+        )
+    return CREDENTIAL_TYPES[key]
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_credential(credential_type: Optional[str]) -> "TokenCredential":
+    # Imported here so azure.identity is only loaded once credentials are needed
+    import azure.identity
+    
+    return getattr(azure.identity, _credential_class_name(credential_type))()
+
+def _get_shared_credential(credential_type: Optional[str] = None) -> "TokenCredential":
+    """Return a process-wide credential of the given type so tokens are acquired once"""
+    # lru_cache doesn't stop concurrent misses from each building one; the lock does
+    with _lock:
+        return _get_cached_credential(credential_type)
+
+def _build_ssl_context() -> ssl.SSLContext:
+    """
+    Build an SSL context for public Azure Key Vault
+    
+    It trusts the same CA bundle requests would use (REQUESTS_CA_BUNDLE,
+    CURL_CA_BUNDLE, then certifi), so verification doesn't depend on the
+    OS trust store.
+    """
+    ca_bundle = os.getenv('REQUESTS_CA_BUNDLE') or os.getenv('CURL_CA_BUNDLE') or requests.certs.where()
+    if os.path.isdir(ca_bundle):
+        ssl_context = ssl.create_default_context(capath=ca_bundle)
+    else:
+        ssl_context = ssl.create_default_context(cafile=ca_bundle)
+    ssl_context.check_hostname = True
+    ssl_context.verify_mode = ssl.CERT_REQUIRED
+    ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+    return ssl_context
+
+@functools.lru_cache(maxsize=None)
+def _get_ssl_context() -> ssl.SSLContext:
+    """Return the process-wide SSL context shared by the requests and aiohttp transports"""
+    return _build_ssl_context()
+
+@functools.lru_cache(maxsize=256)
+def _is_internal_host(hostname: str) -> bool:
+    """Check whether a vault hostname is a private IP or a custom (non-Azure) domain"""
+    try:
+        address = ipaddress.ip_address(hostname)
+    except ValueError:
+        # Not an IP address: anything outside Azure's public domain is internal
+        return hostname == 'localhost' or not hostname.endswith('.azure.net')
+    return address.is_private or address.is_loopback
+
+def _import_http2_transport():
+    """Import the optional HTTP/2 dependencies, returning (httpx, HttpXTransport)"""
+    try:
+        import httpx
+        from azure.core.experimental.transport import HttpXTransport
+    except ImportError:
+        raise ValueError(
+            "HTTP/2 transport requires optional dependencies. Install them with:\n"
+            "pip install \"httpx[http2]\" azure-core-experimental"
+        )
+    return httpx, HttpXTransport
+
+@functools.lru_cache(maxsize=None)
+def _disable_insecure_request_warnings() -> None:
+    """Silence urllib3's unverified-HTTPS warnings (once per process)"""
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+@functools.lru_cache(maxsize=None)
+def _install_fast_json() -> bool:
+    """
+    Decode Key Vault responses with orjson instead of the stdlib json module
+    
+    azure-core has no pluggable JSON decoder, so this swaps the module-level
+    json references used by the response deserializers. Note this affects every
+    Azure SDK client in the process. Runs once, on first client construction;
+    it's a no-op when KV_FAST_JSON=false, orjson isn't installed or the SDK
+    layout doesn't match.
+    
+    Returns:
+        True if at least one deserializer was patched
+    """
+    if os.getenv('KV_FAST_JSON', 'true').lower() == 'false':
+        return False
+    
+    try:
+        import orjson
+    except ImportError:
+        return False
+    
+    # json stand-in: orjson for decoding, stdlib for everything else (dumps, JSONDecodeError, ...)
+    fast_json = types.SimpleNamespace(**vars(json))
+    fast_json.loads = orjson.loads
+    
+    patched = False
+    targets = [
+        # (module, attribute, replacement)
+        ('azure.core.rest._http_response_impl', 'loads', orjson.loads),
+        ('azure.core.pipeline.policies._universal', 'json', fast_json),
+        ('azure.keyvault.secrets._generated._serialization', 'json', fast_json),
+        ('azure.keyvault.secrets._generated._utils.serialization', 'json', fast_json),
+    ]
+    for module_name, attribute, replacement in targets:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        if hasattr(module, attribute):
+            setattr(module, attribute, replacement)
+            patched = True
+    return patched
+
+class _SSLContextAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter that hands a shared SSL context to every urllib3 connection pool"""
+    
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None, **kwargs):
+        # Must be set before HTTPAdapter.__init__, which builds the pool manager
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        if self._ssl_context is not None:
+            kwargs['ssl_context'] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+    
+    def proxy_manager_for(self, *args, **kwargs):
+        if self._ssl_context is not None:
+            kwargs['ssl_context'] = self._ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
+    
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if self._ssl_context is not None and verify:
+            # The shared context already trusts the CA bundle; without this urllib3
+            # would load it into that context again on every new connection
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_session(scheme: str, hostname: str, verify: bool) -> requests.Session:
+    session = requests.Session()
+    session.verify = verify
+    
+    # Pre-size the connection pool for concurrent requests; pool_block=False lets
+    # bursts open extra (non-pooled) connections instead of waiting for a free slot
+    adapter = _SSLContextAdapter(
+        ssl_context=_get_ssl_context() if verify else None,
+        pool_connections=CONNECTION_POOL_SIZE,
+        pool_maxsize=CONNECTION_POOL_SIZE,
+        pool_block=False
+    )
+    session.mount('https://', adapter)
+    session.mount(f"{scheme}://{hostname}/", adapter)
+    return session
+
+def _get_shared_session(scheme: str, hostname: str, verify: bool) -> requests.Session:
+    """
+    Return the process-wide requests session for a vault host
+    
+    Every client talking to the same vault shares one connection pool, so
+    connections opened by one client are reused by the others.
+    """
+    # lru_cache doesn't stop concurrent misses from each building one; the lock does
+    with _lock:
+        return _get_cached_session(scheme, hostname, verify)
+
 class AzureKeyVaultClient:
     """Client for interacting with Azure Key Vault"""
     
-    def __init__(self, vault_url: Optional[str] = None, disable_ssl_verify: bool = False):
+    def __init__(self, vault_url: Optional[str] = None, disable_ssl_verify: bool = False, enable_http2: bool = False):
         """
         Initialize the Azure Key Vault client
         
         Args:
             vault_url: The Azure Key Vault URL (e.g., https://your-vault.vault.azure.net/)
             disable_ssl_verify: Whether to disable SSL verification (use only for testing)
+            enable_http2: Whether to use an HTTP/2 (httpx) transport instead of requests
         """
         # Load environment variables from .env file
-        load_dotenv()
+        _load_dotenv_once()
+        _install_fast_json()
         
         self.vault_url = vault_url or os.getenv('AZURE_KEYVAULT_URL')
         self.disable_ssl_verify = disable_ssl_verify or os.getenv('DISABLE_SSL_VERIFY', 'false').lower() == 'true'
+        self.enable_http2 = enable_http2 or os.getenv('ENABLE_HTTP2', 'false').lower() == 'true'
         
         if not self.vault_url:
             raise ValueError("AZURE_KEYVAULT_URL not found in environment variables or .env file")
@@ -41,68 +277,136 @@ class AzureKeyVaultClient:
         if not self.vault_url.endswith('/'):
             self.vault_url += '/'
         
-        print(f"Connecting to Key Vault: {self.vault_url}")
-        if self.disable_ssl_verify:
-            print("WARNING: SSL verification is disabled")
+        # The credential and transport are built lazily, but configuration errors
+        # should still surface here rather than from the first vault operation
+        _credential_class_name(os.getenv('AZURE_CREDENTIAL_TYPE'))
+        if self.enable_http2:
+            _import_http2_transport()
         
-        # Initialize credentials
-        self.credential = self._get_credential()
+        logger.info("Connecting to Key Vault: %s", self.vault_url)
+        if self.disable_ssl_verify:
+            logger.warning("SSL verification is disabled")
         
-        # Create transport with SSL configuration
-        transport = self._create_transport()
+        # In-memory cache of secret values: name -> (fetch time, value); TTL of 0 disables it
+        self._cache: Dict[str, Tuple[float, str]] = {}
+        try:
+            self._cache_ttl = int(os.getenv('KV_CACHE_TTL', DEFAULT_CACHE_TTL))
+        except ValueError:
+            logger.warning(
+                "Invalid KV_CACHE_TTL '%s', using the default of %d seconds",
+                os.getenv('KV_CACHE_TTL'), DEFAULT_CACHE_TTL
+            )
+            self._cache_ttl = DEFAULT_CACHE_TTL
+        # Bumped by set_secret so a read that raced a write doesn't cache the old value
+        self._cache_generations: Dict[str, int] = {}
+        self._cache_lock = threading.Lock()
         
-        # Initialize client with custom transport
-        self.client = SecretClient(
-            vault_url=self.vault_url, 
-            credential=self.credential,
-            transport=transport
-        )
+        # The credential and SecretClient are created on first use
+        self._client_lock = threading.Lock()
+        self._pipeline_warmed = False
     
-    def _create_transport(self) -> RequestsTransport:
+    @functools.cached_property
+    def credential(self) -> "TokenCredential":
+        """Azure credential, created on first use"""
+        return self._get_credential()
+    
+    @functools.cached_property
+    def client(self) -> SecretClient:
+        """SecretClient for the vault, created (with its transport) on first use"""
+        # Worker threads may race here on the first parallel fetch; build only once.
+        # The result is stored under the lock because cached_property (3.12+) only
+        # writes it after this method returns.
+        with self._client_lock:
+            if 'client' in self.__dict__:
+                return self.__dict__['client']
+            
+            # Create transport with SSL configuration
+            transport = self._create_transport()
+            
+            # Initialize client with custom transport. logging_enable=False is already
+            # azure-core's default; it's spelled out because network tracing would log
+            # request/response bodies, i.e. secret values
+            client = SecretClient(
+                vault_url=self.vault_url, 
+                credential=self.credential,
+                transport=transport,
+                retry_policy=RetryPolicy(**RETRY_OPTIONS),
+                logging_enable=False
+            )
+            self.__dict__['client'] = client
+            return client
+    
+    @functools.cached_property
+    def _fetch_secret(self):
+        """SecretClient.get_secret bound once, so hot loops skip the attribute lookups"""
+        return self.client.get_secret
+    
+    def _create_transport(self) -> HttpTransport:
         """Create a custom transport with SSL configuration"""
-        session = requests.Session()
-        
         # Check if we're connecting to an internal IP or custom domain
         parsed_url = urlparse(self.vault_url)
-        is_internal = (
-            parsed_url.hostname.startswith('10.') or
-            parsed_url.hostname.startswith('192.168.') or
-            parsed_url.hostname.startswith('172.') or
-            parsed_url.hostname in ['localhost', '127.0.0.1'] or
-            not parsed_url.hostname.endswith('.azure.net')
-        )
+        is_internal = _is_internal_host(parsed_url.hostname)
         
+        ssl_context = None
         if self.disable_ssl_verify or is_internal:
             # Disable SSL verification for internal Key Vaults or when explicitly requested
-            session.verify = False
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            _disable_insecure_request_warnings()
             
             if is_internal:
-                print(f"Detected internal Key Vault ({parsed_url.hostname}) - SSL verification disabled")
+                logger.info("Detected internal Key Vault (%s) - SSL verification disabled", parsed_url.hostname)
             else:
-                print("WARNING: SSL verification is disabled. This should only be used for testing.")
+                logger.warning("SSL verification is disabled. This should only be used for testing.")
         else:
             # Configure SSL context for public Azure Key Vault
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = True
-            ssl_context.verify_mode = ssl.CERT_REQUIRED
-            ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
-            session.verify = True
-            print("Configured for public Azure Key Vault (strict SSL verification)")
+            ssl_context = _get_ssl_context()
+            logger.info("Configured for public Azure Key Vault (strict SSL verification)")
         
-        # Configure session with SSL context
-        adapter = requests.adapters.HTTPAdapter()
-        session.mount('https://', adapter)
+        if self.enable_http2:
+            return self._create_http2_transport(verify=ssl_context is not None)
+        
+        session = _get_shared_session(parsed_url.scheme, parsed_url.hostname, ssl_context is not None)
+        
+        # The session is shared, so closing this client must not close it
+        return RequestsTransport(session=session, session_owner=False)
+    
+    def _create_http2_transport(self, verify: bool) -> HttpTransport:
+        """
+        Create an httpx-based transport that multiplexes requests over HTTP/2
+        
+        Concurrent requests share a single TLS connection as separate streams,
+        so parallel secret fetches don't need one connection each.
+        
+        Args:
+            verify: Whether to verify the vault's certificate
+        """
+        httpx, HttpXTransport = _import_http2_transport()
         
-        return RequestsTransport(session=session)
+        # httpx gets its own context: httpcore sets ALPN (h2) on it, which must not
+        # leak into the shared context used by the requests and aiohttp transports
+        client = httpx.Client(
+            http2=True,
+            verify=_build_ssl_context() if verify else False,
+            limits=httpx.Limits(
+                max_connections=CONNECTION_POOL_SIZE,
+                max_keepalive_connections=CONNECTION_POOL_SIZE
+            )
+        )
+        logger.info("Using HTTP/2 transport")
+        return HttpXTransport(client=client)
     
-    def _get_credential(self) -> DefaultAzureCredential:
-        """Get Azure credentials using various authentication methods"""
+    def _get_credential(self) -> "TokenCredential":
+        """
+        Get Azure credentials using various authentication methods
+        
+        AZURE_CREDENTIAL_TYPE selects a specific credential (see CREDENTIAL_TYPES);
+        otherwise DefaultAzureCredential tries Azure CLI, managed identity, etc.
+        """
+        credential_type = os.getenv('AZURE_CREDENTIAL_TYPE')
+        credential_name = _credential_class_name(credential_type)
         try:
-            # Use DefaultAzureCredential (Azure CLI, managed identity, etc.)
-            return DefaultAzureCredential()
+            return _get_shared_credential(credential_type)
         except Exception as e:
-            print(f"DefaultAzureCredential failed: {e}")
+            logger.error("%s failed: %s", credential_name, e)
             raise ValueError(
                 "No valid credentials found. Please ensure you have:\n"
                 "1. Azure CLI installed and logged in (az login)\n"
@@ -118,34 +422,78 @@ class AzureKeyVaultClient:
             True if connection is successful, False otherwise
         """
         try:
-            print("Testing connection...")
-            # Try to list secrets as a connection test
-            secrets = list(self.client.list_properties_of_secrets())
-            print(f"✓ Connection to Azure Key Vault successful! Found {len(secrets)} secrets.")
+            logger.info("Testing connection...")
+            # Try to list secrets as a connection test (counted page by page, not kept)
+            count = sum(1 for _ in self.client.list_properties_of_secrets())
+            logger.info("✓ Connection to Azure Key Vault successful! Found %d secrets.", count)
             return True
         except Exception as e:
-            print(f"✗ Connection to Azure Key Vault failed: {e}")
-            print("\nTroubleshooting suggestions:")
-            print("1. For internal Key Vaults, try setting DISABLE_SSL_VERIFY=true")
-            print("2. Verify your Azure credentials with 'az login'")
-            print("3. Check if the Key Vault URL is correct")
+            logger.error(
+                "✗ Connection to Azure Key Vault failed: %s\n\n"
+                "Troubleshooting suggestions:\n"
+                "1. For internal Key Vaults, try setting DISABLE_SSL_VERIFY=true\n"
+                "2. Verify your Azure credentials with 'az login'\n"
+                "3. Check if the Key Vault URL is correct",
+                e
+            )
             return False
     
+    def _get_cached_secret(self, secret_name: str) -> Optional[str]:
+        """Return a cached secret value, or None if it's missing or expired"""
+        with self._cache_lock:
+            entry = self._cache.get(secret_name)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self._cache_ttl:
+                del self._cache[secret_name]
+                return None
+            return entry[1]
+    
+    def _cache_generation(self, secret_name: str) -> int:
+        """Return how many times the secret has been written through this client"""
+        with self._cache_lock:
+            return self._cache_generations.get(secret_name, 0)
+    
+    def _cache_secret(self, secret_name: str, secret_value: Optional[str], generation: int) -> None:
+        """
+        Store a secret value in the cache, evicting the oldest entry when full
+        
+        The value is dropped if the secret was written since generation was read,
+        since it may predate that write.
+        """
+        if self._cache_ttl <= 0 or secret_value is None:
+            return
+        with self._cache_lock:
+            if self._cache_generations.get(secret_name, 0) != generation:
+                return
+            self._cache.pop(secret_name, None)
+            if len(self._cache) >= SECRET_CACHE_MAX_ENTRIES:
+                del self._cache[next(iter(self._cache))]
+            self._cache[secret_name] = (time.monotonic(), secret_value)
+    
     def get_secret(self, secret_name: str) -> Optional[str]:
         """
         Get a secret from Azure Key Vault
         
+        Values are cached in memory for KV_CACHE_TTL seconds (default 300).
+        
         Args:
             secret_name: Name of the secret to retrieve
             
         Returns:
             The secret value or None if not found
         """
+        cached = self._get_cached_secret(secret_name)
+        if cached is not None:
+            return cached
+        
+        generation = self._cache_generation(secret_name)
         try:
-            secret = self.client.get_secret(secret_name)
+            secret = self._fetch_secret(secret_name)
+            self._cache_secret(secret_name, secret.value, generation)
             return secret.value
         except AzureError as e:
-            print(f"Error retrieving secret '{secret_name}': {e}")
+            logger.error("Error retrieving secret '%s': %s", secret_name, e)
             return None
     
     def set_secret(self, secret_name: str, secret_value: str) -> bool:
@@ -161,43 +509,110 @@ class AzureKeyVaultClient:
         """
         try:
             self.client.set_secret(secret_name, secret_value)
-            print(f"Secret '{secret_name}' set successfully")
+            
+            # Drop the cached value once the write has landed, and bump the generation
+            # so a read still in flight from before the write won't re-cache the old value
+            with self._cache_lock:
+                self._cache.pop(secret_name, None)
+                self._cache_generations[secret_name] = self._cache_generations.get(secret_name, 0) + 1
+            logger.info("Secret '%s' set successfully", secret_name)
             return True
         except AzureError as e:
-            print(f"Error setting secret '{secret_name}': {e}")
+            logger.error("Error setting secret '%s': %s", secret_name, e)
             return False
     
-    def list_secrets(self) -> list:
+    def list_secrets(self) -> Iterator[str]:
         """
         List all secrets in the Key Vault
         
-        Returns:
-            List of secret names
+        Names are yielded as each page arrives instead of being collected first.
+        
+        Yields:
+            Secret names
         """
         try:
-            secrets = []
             for secret_properties in self.client.list_properties_of_secrets():
-                secrets.append(secret_properties.name)
-            return secrets
+                yield secret_properties.name
         except AzureError as e:
-            print(f"Error listing secrets: {e}")
-            return []
+            logger.error("Error listing secrets: %s", e)
     
-    def get_multiple_secrets(self, secret_names: list) -> Dict[str, Optional[str]]:
+    def get_multiple_secrets(self, secret_names: list, max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[str, Optional[str]]:
         """
         Get multiple secrets from Azure Key Vault
         
+        Secrets are fetched in parallel, since each lookup is a separate HTTP round-trip.
+        
         Args:
             secret_names: List of secret names to retrieve
+            max_workers: Maximum number of concurrent requests to Key Vault
             
         Returns:
-            Dictionary mapping secret names to their values
+            Dictionary mapping secret names to their values (in the requested order)
         """
-        results = {}
-        for secret_name in secret_names:
-            results[secret_name] = self.get_secret(secret_name)
+        # Pre-fill to keep the caller's ordering and drop duplicate names
+        results = dict.fromkeys(secret_names)
+        for name in results:
+            results[name] = self._get_cached_secret(name)
+        
+        # Only go to the vault for names that aren't cached
+        uncached = [name for name, value in results.items() if value is None]
+        if not uncached:
+            return results
+        
+        # The first request answers the vault's auth challenge and caches the token in
+        # the client's pipeline; send it alone so workers don't all race on a cold policy
+        if not self._pipeline_warmed:
+            first = uncached.pop(0)
+            results[first] = self.get_secret(first)
+            self._pipeline_warmed = True
+            if not uncached:
+                return results
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(uncached)))) as executor:
+            futures = {executor.submit(self.get_secret, name): name for name in uncached}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
         return results
     
+    def get_all_secrets(self, max_workers: int = DEFAULT_MAX_WORKERS) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Get the values of all secrets in the Key Vault
+        
+        Key Vault has no multi-get, so each page of secret names is resolved
+        concurrently while the next page is being listed. Results are yielded
+        as soon as they arrive, in no particular order.
+        
+        Args:
+            max_workers: Maximum number of concurrent requests to Key Vault
+            
+        Yields:
+            (secret name, secret value) tuples
+        """
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        futures = {}
+        try:
+            try:
+                # Listing the first page also warms the pipeline's auth before any worker runs
+                pages = self.client.list_properties_of_secrets(max_page_size=LIST_PAGE_SIZE).by_page()
+                for page in pages:
+                    for secret_properties in page:
+                        futures[executor.submit(self.get_secret, secret_properties.name)] = secret_properties.name
+                    
+                    # Hand back whatever finished while this page was being listed
+                    for future in [f for f in futures if f.done()]:
+                        yield futures.pop(future), future.result()
+            except AzureError as e:
+                logger.error("Error listing secrets: %s", e)
+            
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # If the caller stopped early, drop the fetches that haven't started instead
+            # of waiting on them (shutdown's cancel_futures needs Python 3.9)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
     def get_secrets_by_prefix(self, prefix: str) -> Dict[str, Optional[str]]:
         """
         Get all secrets that start with a specific prefix (letters before first "-")
@@ -209,27 +624,28 @@ class AzureKeyVaultClient:
             Dictionary mapping secret names to their values
         """
         try:
-            all_secrets = self.list_secrets()
             matching_secrets = []
             
-            for secret_name in all_secrets:
+            for secret_name in self.list_secrets():
                 # Check if secret name starts with the prefix followed by "-"
                 if secret_name.startswith(f"{prefix}-"):
                     matching_secrets.append(secret_name)
             
             if not matching_secrets:
-                print(f"No secrets found with prefix '{prefix}-'")
+                logger.info("No secrets found with prefix '%s-'", prefix)
                 return {}
             
-            print(f"Found {len(matching_secrets)} secrets with prefix '{prefix}-':")
-            for secret in matching_secrets:
-                print(f"  - {secret}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Found %d secrets with prefix '%s-':\n%s",
+                    len(matching_secrets), prefix, "\n".join(f"  - {secret}" for secret in matching_secrets)
+                )
             
             # Get the values for all matching secrets
             return self.get_multiple_secrets(matching_secrets)
             
         except Exception as e:
-            print(f"Error getting secrets by prefix '{prefix}': {e}")
+            logger.error("Error getting secrets by prefix '%s': %s", prefix, e)
             return {}
     
     def save_secrets_to_env_file(self, secrets: Dict[str, Optional[str]], filename: str) -> bool:
@@ -255,13 +671,103 @@ class AzureKeyVaultClient:
                         env_var_name = secret_name.upper().replace('-', '_')
                         f.write(f"{env_var_name}={secret_value}\n")
             
-            print(f"✓ Secrets saved to {filename}")
+            logger.info("✓ Secrets saved to %s", filename)
             return True
             
         except Exception as e:
-            print(f"Error saving secrets to {filename}: {e}")
+            logger.error("Error saving secrets to %s: %s", filename, e)
             return False
 
+@functools.lru_cache(maxsize=8)
+def _get_cached_client(vault_url: Optional[str], disable_ssl_verify: bool, enable_http2: bool) -> AzureKeyVaultClient:
+    return AzureKeyVaultClient(vault_url=vault_url, disable_ssl_verify=disable_ssl_verify, enable_http2=enable_http2)
+
+def get_client(vault_url: Optional[str] = None, disable_ssl_verify: bool = False, enable_http2: bool = False) -> AzureKeyVaultClient:
+    """
+    Get a shared Azure Key Vault client
+    
+    Clients are cached per (vault_url, disable_ssl_verify, enable_http2), so repeated callers reuse
+    the same credential and connection pool instead of rebuilding them.
+    
+    Args:
+        vault_url: The Azure Key Vault URL (defaults to AZURE_KEYVAULT_URL)
+        disable_ssl_verify: Whether to disable SSL verification (use only for testing)
+        enable_http2: Whether to use an HTTP/2 (httpx) transport instead of requests
+        
+    Returns:
+        The cached AzureKeyVaultClient instance
+    """
+    with _lock:
+        return _get_cached_client(vault_url, disable_ssl_verify, enable_http2)
+
+def _cmd_test(client: AzureKeyVaultClient, args: list) -> None:
+    client.test_connection()
+
+def _cmd_get(client: AzureKeyVaultClient, args: list) -> None:
+    secret_name = args[0]
+    value = client.get_secret(secret_name)
+    if value:
+        print(f"{secret_name}: {value}")
+    else:
+        print(f"Secret '{secret_name}' not found or error occurred")
+
+def _cmd_set(client: AzureKeyVaultClient, args: list) -> None:
+    secret_name, secret_value = args[0], args[1]
+    success = client.set_secret(secret_name, secret_value)
+    if not success:
+        sys.exit(1)
+
+def _cmd_list(client: AzureKeyVaultClient, args: list) -> None:
+    found = False
+    for secret in client.list_secrets():
+        if not found:
+            print("Available secrets:")
+            found = True
+        print(f"  - {secret}")
+    if not found:
+        print("No secrets found or error occurred")
+
+def _cmd_get_multiple(client: AzureKeyVaultClient, args: list) -> None:
+    results = client.get_multiple_secrets(args)
+    for name, value in results.items():
+        if value:
+            print(f"{name}: {value}")
+        else:
+            print(f"{name}: [NOT FOUND]")
+
+def _cmd_get_prefix(client: AzureKeyVaultClient, args: list) -> None:
+    prefix = args[0]
+    secrets_by_prefix = client.get_secrets_by_prefix(prefix)
+    if secrets_by_prefix:
+        print(f"Secrets with prefix '{prefix}-':")
+        for name, value in secrets_by_prefix.items():
+            if value:
+                print(f"  - {name}: {value}")
+            else:
+                print(f"  - {name}: [NOT FOUND]")
+    else:
+        print(f"No secrets found with prefix '{prefix}-'")
+
+def _cmd_get_prefix_save(client: AzureKeyVaultClient, args: list) -> None:
+    prefix = args[0]
+    secrets_by_prefix = client.get_secrets_by_prefix(prefix)
+    if secrets_by_prefix:
+        filename = f"{prefix}.env"
+        client.save_secrets_to_env_file(secrets_by_prefix, filename)
+    else:
+        print(f"No secrets found with prefix '{prefix}-' to save.")
+
+# CLI commands: name -> (handler, minimum number of arguments)
+_COMMANDS = {
+    'test': (_cmd_test, 0),
+    'get': (_cmd_get, 1),
+    'set': (_cmd_set, 2),
+    'list': (_cmd_list, 0),
+    'get-multiple': (_cmd_get_multiple, 1),
+    'get-prefix': (_cmd_get_prefix, 1),
+    'get-prefix-save': (_cmd_get_prefix_save, 1),
+}
+
 def main():
     """Main function for command-line usage"""
     if len(sys.argv) < 2:
@@ -275,80 +781,30 @@ def main():
         print("  python keyvault_client.py get-prefix-save <prefix>")
         print("\nEnvironment variables:")
         print("  DISABLE_SSL_VERIFY=true  # Disable SSL verification (testing only)")
+        print("  ENABLE_HTTP2=true        # Use the HTTP/2 transport (requires httpx[http2])")
+        sys.exit(1)
+    
+    # Validate the command before paying for client setup
+    handler, min_args = _COMMANDS.get(sys.argv[1].lower(), (None, 0))
+    args = sys.argv[2:]
+    if handler is None or len(args) < min_args:
+        print("Invalid command or missing arguments")
         sys.exit(1)
     
+    # Show the client's progress messages on the console
+    log_handler = logging.StreamHandler(sys.stdout)
+    log_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(log_handler)
+    logger.setLevel(logging.INFO)
+    
     try:
-        # Check if SSL verification should be disabled
-        disable_ssl = os.getenv('DISABLE_SSL_VERIFY', 'false').lower() == 'true'
-        
-        client = AzureKeyVaultClient(disable_ssl_verify=disable_ssl)
-        command = sys.argv[1].lower()
-        
-        if command == "test":
-            client.test_connection()
-        
-        elif command == "get" and len(sys.argv) >= 3:
-            secret_name = sys.argv[2]
-            value = client.get_secret(secret_name)
-            if value:
-                print(f"{secret_name}: {value}")
-            else:
-                print(f"Secret '{secret_name}' not found or error occurred")
-        
-        elif command == "set" and len(sys.argv) >= 4:
-            secret_name = sys.argv[2]
-            secret_value = sys.argv[3]
-            success = client.set_secret(secret_name, secret_value)
-            if not success:
-                sys.exit(1)
-        
-        elif command == "list":
-            secrets = client.list_secrets()
-            if secrets:
-                print("Available secrets:")
-                for secret in secrets:
-                    print(f"  - {secret}")
-            else:
-                print("No secrets found or error occurred")
-        
-        elif command == "get-multiple" and len(sys.argv) >= 3:
-            secret_names = sys.argv[2:]
-            results = client.get_multiple_secrets(secret_names)
-            for name, value in results.items():
-                if value:
-                    print(f"{name}: {value}")
-                else:
-                    print(f"{name}: [NOT FOUND]")
-        
-        elif command == "get-prefix" and len(sys.argv) >= 3:
-            prefix = sys.argv[2]
-            secrets_by_prefix = client.get_secrets_by_prefix(prefix)
-            if secrets_by_prefix:
-                print(f"Secrets with prefix '{prefix}-':")
-                for name, value in secrets_by_prefix.items():
-                    if value:
-                        print(f"  - {name}: {value}")
-                    else:
-                        print(f"  - {name}: [NOT FOUND]")
-            else:
-                print(f"No secrets found with prefix '{prefix}-'")
-        
-        elif command == "get-prefix-save" and len(sys.argv) >= 3:
-            prefix = sys.argv[2]
-            secrets_by_prefix = client.get_secrets_by_prefix(prefix)
-            if secrets_by_prefix:
-                filename = f"{prefix}.env"
-                client.save_secrets_to_env_file(secrets_by_prefix, filename)
-            else:
-                print(f"No secrets found with prefix '{prefix}-' to save.")
-        
-        else:
-            print("Invalid command or missing arguments")
-            sys.exit(1)
+        # The client reads DISABLE_SSL_VERIFY and the other settings itself
+        client = AzureKeyVaultClient()
+        handler(client, args)
     
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
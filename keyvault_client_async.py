@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Async Azure Key Vault Client for local development
+Connects to Azure Key Vault using credentials from .env file, issuing
+requests concurrently on a single event loop
+"""
+
+import os
+import asyncio
+import logging
+from typing import Optional, Dict
+import aiohttp
+import azure.identity.aio
+from azure.core.credentials_async import AsyncTokenCredential
+from azure.keyvault.secrets.aio import SecretClient
+from azure.core.exceptions import AzureError
+from azure.core.pipeline.policies import AsyncRetryPolicy
+from azure.core.pipeline.transport import AioHttpTransport
+from urllib.parse import urlparse
+
+from keyvault_client import (
+    RETRY_OPTIONS,
+    _credential_class_name,
+    _disable_insecure_request_warnings,
+    _get_ssl_context,
+    _install_fast_json,
+    _load_dotenv_once,
+    _is_internal_host,
+)
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of simultaneous connections to the vault
+CONNECTION_LIMIT = 64
+
+class AsyncAzureKeyVaultClient:
+    """
+    Async client for interacting with Azure Key Vault
+    
+    Use as an async context manager so the HTTP session and credential are closed:
+    
+        async with AsyncAzureKeyVaultClient() as client:
+            value = await client.get_secret("my-secret-name")
+    """
+    
+    def __init__(self, vault_url: Optional[str] = None, disable_ssl_verify: bool = False):
+        """
+        Initialize the async Azure Key Vault client
+        
+        Args:
+            vault_url: The Azure Key Vault URL (e.g., https://your-vault.vault.azure.net/)
+            disable_ssl_verify: Whether to disable SSL verification (use only for testing)
+        """
+        # Load environment variables from .env file
+        _load_dotenv_once()
+        _install_fast_json()
+        
+        self.vault_url = vault_url or os.getenv('AZURE_KEYVAULT_URL')
+        self.disable_ssl_verify = disable_ssl_verify or os.getenv('DISABLE_SSL_VERIFY', 'false').lower() == 'true'
+        
+        if not self.vault_url:
+            raise ValueError("AZURE_KEYVAULT_URL not found in environment variables or .env file")
+        
+        # Ensure the URL ends with a slash
+        if not self.vault_url.endswith('/'):
+            self.vault_url += '/'
+        
+        logger.info("Connecting to Key Vault: %s", self.vault_url)
+        if self.disable_ssl_verify:
+            logger.warning("SSL verification is disabled")
+        
+        # Initialize credentials
+        self.credential = self._get_credential()
+        
+        # The aiohttp session must be created inside a running event loop,
+        # so the client is built when the context manager is entered
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._client: Optional[SecretClient] = None
+        self._pipeline_warmed = False
+    
+    async def __aenter__(self) -> "AsyncAzureKeyVaultClient":
+        await self.open()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    @property
+    def client(self) -> SecretClient:
+        """The underlying async SecretClient (available once the client is open)"""
+        if self._client is None:
+            raise RuntimeError("Client is not open; use 'async with AsyncAzureKeyVaultClient() as client:'")
+        return self._client
+    
+    async def open(self) -> None:
+        """Create the HTTP session and SecretClient"""
+        if self._client is not None:
+            return
+        
+        transport = self._create_transport()
+        
+        # Initialize client with custom transport. logging_enable=False is already
+        # azure-core's default; it's spelled out because network tracing would log
+        # request/response bodies, i.e. secret values
+        self._client = SecretClient(
+            vault_url=self.vault_url,
+            credential=self.credential,
+            transport=transport,
+            retry_policy=AsyncRetryPolicy(**RETRY_OPTIONS),
+            logging_enable=False
+        )
+    
+    async def close(self) -> None:
+        """Close the SecretClient, the HTTP session and the credential"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        await self.credential.close()
+    
+    def _create_transport(self) -> AioHttpTransport:
+        """Create a custom aiohttp transport with SSL configuration"""
+        # Check if we're connecting to an internal IP or custom domain
+        parsed_url = urlparse(self.vault_url)
+        is_internal = _is_internal_host(parsed_url.hostname)
+        
+        if self.disable_ssl_verify or is_internal:
+            # Disable SSL verification for internal Key Vaults or when explicitly requested
+            ssl_context = False
+            _disable_insecure_request_warnings()
+            
+            if is_internal:
+                logger.info("Detected internal Key Vault (%s) - SSL verification disabled", parsed_url.hostname)
+            else:
+                logger.warning("SSL verification is disabled. This should only be used for testing.")
+        else:
+            # Configure SSL context for public Azure Key Vault
+            ssl_context = _get_ssl_context()
+            logger.info("Configured for public Azure Key Vault (strict SSL verification)")
+        
+        # One pooled session shared by every concurrent request
+        connector = aiohttp.TCPConnector(limit=CONNECTION_LIMIT, ssl=ssl_context)
+        self._session = aiohttp.ClientSession(connector=connector)
+        
+        # We close the session ourselves in close()
+        return AioHttpTransport(session=self._session, session_owner=False)
+    
+    def _get_credential(self) -> AsyncTokenCredential:
+        """
+        Get Azure credentials using various authentication methods
+        
+        AZURE_CREDENTIAL_TYPE selects a specific credential (see CREDENTIAL_TYPES);
+        otherwise DefaultAzureCredential tries Azure CLI, managed identity, etc.
+        """
+        credential_name = _credential_class_name(os.getenv('AZURE_CREDENTIAL_TYPE'))
+        try:
+            return getattr(azure.identity.aio, credential_name)()
+        except Exception as e:
+            logger.error("%s failed: %s", credential_name, e)
+            raise ValueError(
+                "No valid credentials found. Please ensure you have:\n"
+                "1. Azure CLI installed and logged in (az login)\n"
+                "2. Or running in Azure with managed identity enabled\n"
+                "3. AZURE_KEYVAULT_URL set in environment variables"
+            )
+    
+    async def test_connection(self) -> bool:
+        """
+        Test the connection to Azure Key Vault
+        
+        Returns:
+            True if connection is successful, False otherwise
+        """
+        try:
+            logger.info("Testing connection...")
+            # Try to list secrets as a connection test
+            count = 0
+            async for _ in self.client.list_properties_of_secrets():
+                count += 1
+            logger.info("✓ Connection to Azure Key Vault successful! Found %d secrets.", count)
+            return True
+        except Exception as e:
+            logger.error(
+                "✗ Connection to Azure Key Vault failed: %s\n\n"
+                "Troubleshooting suggestions:\n"
+                "1. For internal Key Vaults, try setting DISABLE_SSL_VERIFY=true\n"
+                "2. Verify your Azure credentials with 'az login'\n"
+                "3. Check if the Key Vault URL is correct",
+                e
+            )
+            return False
+    
+    async def get_secret(self, secret_name: str) -> Optional[str]:
+        """
+        Get a secret from Azure Key Vault
+        
+        Args:
+            secret_name: Name of the secret to retrieve
+        
+        Returns:
+            The secret value or None if not found
+        """
+        try:
+            secret = await self.client.get_secret(secret_name)
+            return secret.value
+        except AzureError as e:
+            logger.error("Error retrieving secret '%s': %s", secret_name, e)
+            return None
+    
+    async def set_secret(self, secret_name: str, secret_value: str) -> bool:
+        """
+        Set a secret in Azure Key Vault
+        
+        Args:
+            secret_name: Name of the secret
+            secret_value: Value of the secret
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self.client.set_secret(secret_name, secret_value)
+            logger.info("Secret '%s' set successfully", secret_name)
+            return True
+        except AzureError as e:
+            logger.error("Error setting secret '%s': %s", secret_name, e)
+            return False
+    
+    async def list_secrets(self) -> list:
+        """
+        List all secrets in the Key Vault
+        
+        Returns:
+            List of secret names
+        """
+        try:
+            return [secret_properties.name async for secret_properties in self.client.list_properties_of_secrets()]
+        except AzureError as e:
+            logger.error("Error listing secrets: %s", e)
+            return []
+    
+    async def get_multiple_secrets(self, secret_names: list) -> Dict[str, Optional[str]]:
+        """
+        Get multiple secrets from Azure Key Vault
+        
+        All lookups are issued concurrently on the event loop.
+        
+        Args:
+            secret_names: List of secret names to retrieve
+        
+        Returns:
+            Dictionary mapping secret names to their values (in the requested order)
+        """
+        names = list(dict.fromkeys(secret_names))
+        results = {}
+        
+        # The first request answers the vault's auth challenge and caches the token in
+        # the client's pipeline; send it alone so the others don't race on a cold policy
+        if names and not self._pipeline_warmed:
+            results.update(await self._gather_secrets(names[:1]))
+            self._pipeline_warmed = True
+            names = names[1:]
+        
+        results.update(await self._gather_secrets(names))
+        return results
+    
+    async def _gather_secrets(self, names: list) -> Dict[str, Optional[str]]:
+        """Fetch secrets concurrently, logging any failure and mapping it to None"""
+        values = await asyncio.gather(*(self.get_secret(name) for name in names), return_exceptions=True)
+        results = {}
+        for name, value in zip(names, values):
+            if isinstance(value, Exception):
+                logger.error("Error retrieving secret '%s': %s", name, value)
+                value = None
+            results[name] = value
+        return results
+    
+    async def get_secrets_by_prefix(self, prefix: str) -> Dict[str, Optional[str]]:
+        """
+        Get all secrets that start with a specific prefix (letters before first "-")
+        
+        Args:
+            prefix: The prefix to filter secrets by (e.g., "AI" for "AI-something")
+        
+        Returns:
+            Dictionary mapping secret names to their values
+        """
+        try:
+            all_secrets = await self.list_secrets()
+            
+            # Check if secret name starts with the prefix followed by "-"
+            matching_secrets = [name for name in all_secrets if name.startswith(f"{prefix}-")]
+            
+            if not matching_secrets:
+                logger.info("No secrets found with prefix '%s-'", prefix)
+                return {}
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Found %d secrets with prefix '%s-':\n%s",
+                    len(matching_secrets), prefix, "\n".join(f"  - {secret}" for secret in matching_secrets)
+                )
+            
+            # Get the values for all matching secrets
+            return await self.get_multiple_secrets(matching_secrets)
+        
+        except Exception as e:
+            logger.error("Error getting secrets by prefix '%s': %s", prefix, e)
+            return {}